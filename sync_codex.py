@@ -1,39 +1,122 @@
 from __future__ import annotations
 
+import os
 import shutil
+import stat
 import sys
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 
 DIRECTORIES = ("agents", "hooks", "skills")
 FILES = ("AGENTS.md",)
+COPY_WORKERS = 8
 
 
 class SyncError(RuntimeError):
     pass
 
 
-def copy_directory(source: Path, target: Path) -> None:
+def copy_if_changed(
+    source: Path, target: Path, source_stat: os.stat_result | None = None
+) -> None:
+    # copy2 preserves mtime and mode, so a target with the same size, mtime
+    # and mode is taken to be unchanged. chmod does not bump mtime, so the
+    # mode is compared separately.
+    try:
+        if source_stat is None:
+            source_stat = source.stat()
+        target_stat = target.stat()
+    except OSError:
+        shutil.copy2(source, target)
+        return
+
+    if (
+        source_stat.st_size != target_stat.st_size
+        or source_stat.st_mtime_ns != target_stat.st_mtime_ns
+        or stat.S_IMODE(source_stat.st_mode) != stat.S_IMODE(target_stat.st_mode)
+    ):
+        shutil.copy2(source, target)
+
+
+def _raise_walk_error(exc: OSError) -> None:
+    raise exc
+
+
+def collect_directory_files(
+    source: Path, target: Path
+) -> tuple[list[tuple[Path, Path]], list[tuple[Path, Path]]]:
     if not source.is_dir():
         raise SyncError(f"source directory not found: {source}")
 
+    # Target directories are created here, up front, so the copy workers
+    # never race on mkdir.
+    directory_pairs: list[tuple[Path, Path]] = []
+    file_pairs: list[tuple[Path, Path]] = []
     try:
-        shutil.copytree(source, target, dirs_exist_ok=True)
+        for dir_path, _, file_names in os.walk(
+            source, onerror=_raise_walk_error, followlinks=True
+        ):
+            source_dir = Path(dir_path)
+            target_dir = target / source_dir.relative_to(source)
+            target_dir.mkdir(parents=True, exist_ok=True)
+            directory_pairs.append((source_dir, target_dir))
+            file_pairs.extend(
+                (source_dir / file_name, target_dir / file_name)
+                for file_name in file_names
+            )
     except OSError as exc:
         raise SyncError(
             f"failed to copy directory from {source} to {target}: {exc}"
         ) from exc
 
+    return directory_pairs, file_pairs
+
+
+def copy_directory_stats(pairs: Sequence[tuple[Path, Path]]) -> None:
+    # Like copytree, apply directory permissions and mtimes only after the
+    # files are in place, since writing into a directory bumps its mtime.
+    for source, target in pairs:
+        try:
+            shutil.copystat(source, target)
+        except OSError as exc:
+            raise SyncError(
+                f"failed to copy directory metadata from {source} to {target}: {exc}"
+            ) from exc
+
+
+def copy_files(pairs: Sequence[tuple[Path, Path]]) -> None:
+    with ThreadPoolExecutor(max_workers=COPY_WORKERS) as executor:
+        futures = {
+            executor.submit(copy_if_changed, source, target): (source, target)
+            for source, target in pairs
+        }
+        for future in as_completed(futures):
+            try:
+                future.result()
+            except OSError as exc:
+                for pending in futures:
+                    pending.cancel()
+                source, target = futures[future]
+                raise SyncError(
+                    f"failed to copy file from {source} to {target}: {exc}"
+                ) from exc
+
 
 def copy_file(source: Path, target: Path) -> bool:
     if not source.exists():
         return False
-    if not source.is_file():
+    try:
+        source_stat = source.stat()
+    except OSError as exc:
+        raise SyncError(f"failed to read source file {source}: {exc}") from exc
+    if not stat.S_ISREG(source_stat.st_mode):
         raise SyncError(f"source path is not a file: {source}")
 
     try:
         target.parent.mkdir(parents=True, exist_ok=True)
-        shutil.copy2(source, target)
+        copy_if_changed(source, target, source_stat)
     except OSError as exc:
         raise SyncError(f"failed to copy file from {source} to {target}: {exc}") from exc
 
@@ -48,9 +131,17 @@ def sync_codex_config(source_root: Path, target_root: Path) -> list[str]:
     except OSError as exc:
         raise SyncError(f"failed to create target directory {target_root}: {exc}") from exc
 
+    directory_pairs: list[tuple[Path, Path]] = []
+    file_pairs: list[tuple[Path, Path]] = []
     for directory in DIRECTORIES:
-        copy_directory(source_root / directory, target_root / directory)
-        messages.append(f"copied {directory}/")
+        directories, files = collect_directory_files(
+            source_root / directory, target_root / directory
+        )
+        directory_pairs.extend(directories)
+        file_pairs.extend(files)
+    copy_files(file_pairs)
+    copy_directory_stats(directory_pairs)
+    messages.extend(f"copied {directory}/" for directory in DIRECTORIES)
 
     for file_name in FILES:
         copied = copy_file(source_root / file_name, target_root / file_name)
@@ -72,8 +163,7 @@ def main() -> int:
         print(f"error: {exc}", file=sys.stderr)
         return 1
 
-    for message in messages:
-        print(message)
+    print("\n".join(messages))
 
     return 0
 